@@ -12,7 +12,12 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from trust_layer.validator import TrustLayerValidator, AIPrediction
+from trust_layer.validator import (
+    STATUS_NAMES,
+    AIPrediction,
+    TrustLayerValidator,
+    VerificationStatus,
+)
 
 
 def run_demo():
@@ -41,7 +46,7 @@ def run_demo():
     
     print(f"Result: {'✅ PASSED' if passed else '❌ FAILED'}")
     for r in results:
-        print(f"  - [{r.status.value.upper()}] {r.claim_type}: {r.claim_value} vs {r.source_value}")
+        print(f"  - [{STATUS_NAMES[r.status].upper()}] {r.claim_type}: {r.claim_value} vs {r.source_value}")
         if r.metadata:
             print(f"    Metadata: {r.metadata}")
 
@@ -68,10 +73,10 @@ def run_demo():
     
     print(f"Result: {'✅ PASSED' if passed else '❌ FAILED'}")
     for r in results:
-        status_icon = "✅" if r.status == "verified" else "mw-emoji" if r.status == "partial" else "❌"
+        status_icon = "✅" if r.status is VerificationStatus.VERIFIED else "mw-emoji" if r.status is VerificationStatus.PARTIAL else "❌"
         # Correct icon for partial? use ⚠️
-        if r.status == "partial": status_icon = "⚠️ "
-        if r.status == "failed": status_icon = "❌"
+        if r.status is VerificationStatus.PARTIAL: status_icon = "⚠️ "
+        if r.status is VerificationStatus.FAILED: status_icon = "❌"
         
         print(f"  - [{status_icon}] {r.claim_type}: {r.discrepancy}")
 
@@ -98,7 +103,7 @@ def run_demo():
     
     print(f"Result: {'✅ PASSED' if passed else '❌ FAILED'}")
     for r in results:
-        print(f"  - [{r.status.value.upper()}] {r.claim_type}: {r.discrepancy}")
+        print(f"  - [{STATUS_NAMES[r.status].upper()}] {r.claim_type}: {r.discrepancy}")
         if r.metadata:
             print(f"    Metadata: {r.metadata}")
 
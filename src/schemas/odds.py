@@ -8,8 +8,10 @@ Demonstrates typed validation for real-time data feeds.
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, Optional, List, Tuple
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator
 
 
 class OddsFormat(str, Enum):
@@ -46,6 +48,22 @@ class OddsLine(BaseModel):
             raise ValueError(f"Invalid American odds: {v}")
         return v
     
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "OddsLine":
+        """
+        Build a line from an already-validated feed, skipping validation.
+        
+        Only for trusted sources (e.g. the internal canonical store);
+        values must already have their final types. Untrusted input,
+        including AI output, must go through normal validation.
+        """
+        return cls.model_construct(**data)
+    
+    @classmethod
+    def validate_many(cls, payload: List[Dict[str, Any]]) -> List["OddsLine"]:
+        """Validate a batch of raw lines in a single compiled-schema call."""
+        return _ODDS_LINES_ADAPTER.validate_python(payload)
+    
     def calculate_implied_probability(self) -> Decimal:
         """Calculate implied probability from odds."""
         if self.odds_format == OddsFormat.AMERICAN:
@@ -58,6 +76,9 @@ class OddsLine(BaseModel):
         return Decimal(0)
 
 
+_ODDS_LINES_ADAPTER = TypeAdapter(List[OddsLine])
+
+
 class Market(BaseModel):
     """A betting market with multiple lines."""
     
@@ -92,15 +113,73 @@ class Event(BaseModel):
 
 
 class OddsSnapshot(BaseModel):
-    """A point-in-time snapshot of odds from a provider."""
+    """
+    A point-in-time snapshot of odds from a provider.
+    
+    Snapshots are frozen; the event index is built on first lookup and
+    assumes the events list is not mutated in place afterwards. The index
+    remembers which list it was built from, so copies made with
+    model_copy() rebuild it for their own events.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     provider: str
     captured_at: datetime
     events: List[Event] = Field(default_factory=list)
     
+    # (events list the index was built from, event ID -> event)
+    _event_index: Optional[Tuple[List[Event], Dict[str, Event]]] = PrivateAttr(default=None)
+    
+    def _events_by_id(self) -> Dict[str, Event]:
+        """Event ID -> event (first occurrence wins)."""
+        cached = self._event_index
+        if cached is None or cached[0] is not self.events:
+            index = {event.event_id: event for event in reversed(self.events)}
+            cached = self._event_index = (self.events, index)
+        return cached[1]
+    
     def get_event(self, event_id: str) -> Optional[Event]:
         """Find event by ID."""
-        for event in self.events:
-            if event.event_id == event_id:
-                return event
-        return None
+        return self._events_by_id().get(event_id)
+    
+    def compute_implied_probabilities(self) -> np.ndarray:
+        """
+        Compute implied probability for every line in the snapshot at once.
+        
+        Results are written back to each line's implied_probability and
+        returned as a float64 array in event/market/line order.
+        
+        Raises:
+            ZeroDivisionError: If a decimal-format line has odds of 0, as
+                calculate_implied_probability() would for that line
+        """
+        lines = [
+            line
+            for event in self.events
+            for market in event.markets
+            for line in market.lines
+        ]
+        odds = np.fromiter((line.odds for line in lines), dtype=np.float64, count=len(lines))
+        formats = np.fromiter(
+            (line.odds_format.value for line in lines), dtype="<U10", count=len(lines)
+        )
+        zero_decimal = (formats == OddsFormat.DECIMAL.value) & (odds == 0)
+        if zero_decimal.any():
+            line = lines[int(np.argmax(zero_decimal))]
+            raise ZeroDivisionError(f"Decimal odds of 0 for selection {line.selection!r}")
+        
+        # Only the discarded branch of np.where divides by zero here
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # abs() as in calculate_implied_probability: odds of 0 give 0.0, not -0.0
+            american = np.where(odds > 0, 100.0 / (odds + 100.0), np.abs(odds) / (np.abs(odds) + 100.0))
+            decimal = 1.0 / odds
+        probabilities = np.select(
+            [formats == OddsFormat.AMERICAN.value, formats == OddsFormat.DECIMAL.value],
+            [american, decimal],
+            default=0.0,
+        )
+        
+        for line, probability in zip(lines, probabilities.tolist()):
+            line.implied_probability = Decimal(str(probability))
+        return probabilities
@@ -0,0 +1,301 @@
+"""
+Trust Layer: Persistent Audit Writers
+
+Append-only sinks for verification rows. The in-memory VerificationLog
+only keeps a bounded window; writers keep the full history on disk so it
+can be loaded later as a columnar table for offline analytics.
+
+All writers encode raw values the same way: numeric source/AI values
+(Decimal, int, float or numpy scalars) are always written as int
+fixed-point odds (x1000), and non-finite ones as null, so no intermediate
+strings are built per row. Text values such as team names are written
+unchanged.
+
+A writer receives one row per verification through write() and must be
+closed (or used as a context manager) to flush its last batch.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, List, Optional, Protocol
+
+import numpy as np
+
+from .validator import _as_decimal, _to_scaled
+
+try:
+    import pyarrow as pa
+except ImportError:  # Only needed when an ArrowAuditWriter is created
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # JsonlAuditWriter falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Only needed when a MsgpackAuditWriter is created
+    msgpack = None
+
+
+# Row layout version written as the first field of each msgpack row
+MSGPACK_ROW_SCHEMA = 1
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+class AuditWriter(Protocol):
+    """Interface the VerificationLog expects from a persistent sink."""
+    
+    def write(
+        self,
+        status: int,
+        timestamp: float,
+        claim: str,
+        source_raw: Any,
+        ai_raw: Any,
+        discrepancy: Optional[str]
+    ) -> None: ...
+    
+    def close(self) -> None: ...
+
+
+def _encode_odds(value: Any) -> Any:
+    """
+    Encode a numeric source/AI value as int fixed-point; pass others through.
+    
+    Finite values too large for int64 fixed-point are written as text so
+    no sink has to store an oversized integer.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool) or not isinstance(value, (Decimal, int, float)):
+        return value
+    value = _as_decimal(value)
+    if not value.is_finite():
+        return None
+    scaled = _to_scaled(value)
+    return scaled if _INT64_MIN <= scaled <= _INT64_MAX else str(value)
+
+
+def _encode_value(value: Any) -> Any:
+    """Serializer hook for any remaining numpy scalars."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__} in audit row")
+
+
+def _split_encoded(values: List[Any]) -> List[Any]:
+    """Split encoded values into an int64 odds array and a string array."""
+    odds = [v if type(v) is int else None for v in values]
+    text = [None if v is None or type(v) is int else str(v) for v in values]
+    return [pa.array(odds, type=pa.int64()), pa.array(text, type=pa.string())]
+
+
+class ArrowAuditWriter:
+    """
+    Writes verification rows to an Arrow IPC stream in fixed-size batches.
+    
+    Columns: status (int8 VerificationStatus code), timestamp (epoch
+    seconds), claim, source_odds / ai_odds (int64 fixed-point, x1000),
+    source_text / ai_text (non-numeric values such as team names), and
+    discrepancy. At most one of each odds/text pair is set per row.
+    
+    An IPC stream cannot be appended to, so the writer refuses to open an
+    existing file rather than truncate earlier audit history; start each
+    run on a new path.
+    """
+    
+    def __init__(self, path: str, batch_size: int = 1024):
+        """
+        Open the output stream.
+        
+        Args:
+            path: New file to write the Arrow IPC stream to
+            batch_size: Rows buffered per record batch
+        
+        Raises:
+            FileExistsError: If path already exists
+        """
+        if pa is None:
+            raise ImportError("ArrowAuditWriter requires pyarrow")
+        self.batch_size = batch_size
+        self._schema = pa.schema([
+            ("status", pa.int8()),
+            ("timestamp", pa.float64()),
+            ("claim", pa.string()),
+            ("source_odds", pa.int64()),
+            ("source_text", pa.string()),
+            ("ai_odds", pa.int64()),
+            ("ai_text", pa.string()),
+            ("discrepancy", pa.string()),
+        ])
+        # "x" fails atomically if the file exists
+        self._file = open(path, "xb")
+        self._writer = pa.ipc.new_stream(self._file, self._schema)
+        self._reset()
+    
+    def _reset(self) -> None:
+        self._status: List[int] = []
+        self._ts: List[float] = []
+        self._claim: List[str] = []
+        self._source: List[Any] = []
+        self._ai: List[Any] = []
+        self._discrepancy: List[Optional[str]] = []
+    
+    def write(
+        self,
+        status: int,
+        timestamp: float,
+        claim: str,
+        source_raw: Any,
+        ai_raw: Any,
+        discrepancy: Optional[str]
+    ) -> None:
+        """Buffer one row, flushing once a full batch is collected."""
+        self._status.append(status)
+        self._ts.append(timestamp)
+        self._claim.append(claim)
+        self._source.append(_encode_odds(source_raw))
+        self._ai.append(_encode_odds(ai_raw))
+        self._discrepancy.append(discrepancy)
+        if len(self._status) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered rows as one record batch."""
+        if not self._status:
+            return
+        batch = pa.record_batch([
+            pa.array(self._status, type=pa.int8()),
+            pa.array(self._ts, type=pa.float64()),
+            pa.array(self._claim, type=pa.string()),
+            *_split_encoded(self._source),
+            *_split_encoded(self._ai),
+            pa.array(self._discrepancy, type=pa.string()),
+        ], schema=self._schema)
+        self._writer.write_batch(batch)
+        self._reset()
+    
+    def close(self) -> None:
+        """Flush remaining rows and close the stream."""
+        self.flush()
+        self._writer.close()
+        self._file.close()
+    
+    def __enter__(self) -> "ArrowAuditWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JsonlAuditWriter:
+    """
+    Writes verification rows as JSON lines, using orjson when installed.
+    
+    Keys: s (status code), t (epoch seconds), c (claim), sv (source
+    value), av (AI value), d (discrepancy). Numeric sv/av values are
+    fixed-point odds (x1000).
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open the output file for appending.
+        
+        Args:
+            path: File to append JSON lines to
+        """
+        self._file = open(path, "ab")
+    
+    def write(
+        self,
+        status: int,
+        timestamp: float,
+        claim: str,
+        source_raw: Any,
+        ai_raw: Any,
+        discrepancy: Optional[str]
+    ) -> None:
+        """Append one row."""
+        row = {
+            "s": int(status),
+            "t": timestamp,
+            "c": claim,
+            "sv": _encode_odds(source_raw),
+            "av": _encode_odds(ai_raw),
+            "d": discrepancy,
+        }
+        if orjson is not None:
+            line = orjson.dumps(
+                row,
+                default=_encode_value,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+            )
+        else:
+            line = (json.dumps(row, default=_encode_value) + "\n").encode()
+        self._file.write(line)
+    
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+    
+    def __enter__(self) -> "JsonlAuditWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class MsgpackAuditWriter:
+    """
+    Writes verification rows as a stream of compact msgpack arrays.
+    
+    Each row is [schema, status, timestamp, claim, source_value,
+    ai_value, discrepancy], where schema is MSGPACK_ROW_SCHEMA and
+    numeric values are fixed-point odds (x1000).
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open the output file for appending.
+        
+        Args:
+            path: File to append msgpack rows to
+        """
+        if msgpack is None:
+            raise ImportError("MsgpackAuditWriter requires msgpack")
+        self._packer = msgpack.Packer(default=_encode_value)
+        self._file = open(path, "ab")
+    
+    def write(
+        self,
+        status: int,
+        timestamp: float,
+        claim: str,
+        source_raw: Any,
+        ai_raw: Any,
+        discrepancy: Optional[str]
+    ) -> None:
+        """Append one row."""
+        self._file.write(self._packer.pack([
+            MSGPACK_ROW_SCHEMA,
+            int(status),
+            timestamp,
+            claim,
+            _encode_odds(source_raw),
+            _encode_odds(ai_raw),
+            discrepancy,
+        ]))
+    
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+    
+    def __enter__(self) -> "MsgpackAuditWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
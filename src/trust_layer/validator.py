@@ -12,33 +12,298 @@ Principles:
 4. Log all verifications for audit
 """
 
+import functools
+import numbers
+import re
+import sys
+import time
+from array import array
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional, List, Tuple
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, List, Mapping, Sequence, Tuple, Union
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
 
+import numpy as np
 
-class VerificationStatus(str, Enum):
-    """Result of verification check."""
-    VERIFIED = "verified"
-    FAILED = "failed"
-    PARTIAL = "partial"
-    SKIPPED = "skipped"
+if TYPE_CHECKING:
+    from .audit import AuditWriter
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # Fuzzy fallback is optional; alias/substring checks still run
+    fuzz = None
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError:  # Alias scan falls back to a compiled regex alternation
+    ahocorasick = None
+
+try:
+    import numba
+except ImportError:  # Batch odds kernel falls back to plain numpy
+    numba = None
+
+
+# Fixed-point scale for odds comparisons (odds x 1000 fits comfortably in int64)
+_ODDS_SCALE_EXPONENT = 3
+_ODDS_SCALE = 10 ** _ODDS_SCALE_EXPONENT
+
+
+def _to_scaled(value: Decimal) -> int:
+    """Convert odds to int fixed-point, rounding past three decimals."""
+    return int((value * _ODDS_SCALE).to_integral_value())
+
+
+def _as_decimal(value: Any) -> Decimal:
+    """Coerce int/float/str (or numpy scalar) odds to Decimal, floats via their repr."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, numbers.Integral):
+        return Decimal(int(value))
+    if isinstance(value, float):
+        return Decimal(float.__repr__(value))
+    if isinstance(value, str):
+        return Decimal(value)
+    raise TypeError(f"Odds must be Decimal, int, float or str, not {type(value).__name__}")
+
+
+# Outcomes of the specialized scalar odds check
+_ODDS_EXACT = 0
+_ODDS_WITHIN = 1
+_ODDS_OUTSIDE = 2
+# NaN/inf input, never passed to the specialized check
+_ODDS_INVALID = 3
+
+# Discrepancy for odds that cannot be compared (scalar and batch paths)
+_INVALID_ODDS_DISCREPANCY = "Missing or non-finite odds value"
+
+_ODDS_CHECK_TEMPLATE = """
+def _classify_odds(claimed_odds, source_odds):
+    claimed = claimed_odds.scaleb({exponent})
+    source = source_odds.scaleb({exponent})
+    claimed_int = int(claimed)
+    source_int = int(source)
+    if claimed_int == claimed and source_int == source:
+        diff = claimed_int - source_int
+    else:
+        # Finer than the fixed-point scale: stay exact in Decimal
+        diff = claimed - source
+    if diff == 0:
+        return {exact}
+    return {within} if -{tol} <= diff <= {tol} else {outside}
+"""
+
+
+def _specialize_odds_check(tol_scaled: Decimal):
+    """
+    Generate the scalar odds check with scale and tolerance inlined.
+    
+    A validator keeps one tolerance for its lifetime, so baking it in as
+    a constant saves the attribute load and helper calls per check. A
+    tolerance finer than the fixed-point scale is kept as a Decimal.
+    """
+    integral = tol_scaled == tol_scaled.to_integral_value()
+    namespace: dict = {"_TOL": tol_scaled}
+    exec(
+        _ODDS_CHECK_TEMPLATE.format(
+            exponent=_ODDS_SCALE_EXPONENT,
+            tol=int(tol_scaled) if integral else "_TOL",
+            exact=_ODDS_EXACT,
+            within=_ODDS_WITHIN,
+            outside=_ODDS_OUTSIDE,
+        ),
+        namespace,
+    )
+    return namespace["_classify_odds"]
+
+
+# Largest magnitude the batch path scales; keeps claimed - source +/- tol
+# inside int64
+_SCALED_LIMIT = 2 ** 61
+
+
+def _to_scaled_array(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert an array of odds to int64 fixed-point plus a valid-value mask.
+    
+    Missing, non-finite or out-of-range entries (None, NaN, inf, or too
+    large for int64 fixed-point) are scaled as 0 and flagged False in the
+    mask so callers can fail them explicitly.
+    """
+    as_float = np.asarray(values, dtype=np.float64)
+    valid = np.isfinite(as_float) & (np.abs(as_float) * _ODDS_SCALE < _SCALED_LIMIT)
+    scaled = np.rint(np.where(valid, as_float, 0.0) * _ODDS_SCALE).astype(np.int64)
+    return scaled, valid
+
+
+def _verify_odds_numpy(claimed: np.ndarray, source: np.ndarray, tol: int) -> np.ndarray:
+    """Batch odds kernel used when numba is not installed (same bit test)."""
+    diff = claimed - source
+    return ((((diff + tol) | (tol - diff)) >> 63) & 1).astype(np.int8)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_odds_kernel(parallel: bool = True, boundscheck: bool = False):
+    """
+    Build the batch odds kernel for a set of jit flags (compiled once per set).
+    
+    The kernel maps scaled int64 claimed/source odds to int8 status codes:
+    0 (VERIFIED) within tolerance, 1 (FAILED) otherwise.
+    """
+    if numba is None:
+        return _verify_odds_numpy
+    
+    @numba.njit(parallel=parallel, boundscheck=boundscheck, nogil=True, error_model="numpy")
+    def _verify_odds_kernel(claimed, source, tol):
+        out = np.empty(claimed.shape[0], dtype=np.int8)
+        for i in numba.prange(claimed.shape[0]):
+            # Branchless bound check: the sign bit of either side is set
+            # exactly when |diff| > tol, giving 1 (FAILED) or 0 (VERIFIED)
+            diff = claimed[i] - source[i]
+            out[i] = (((diff + tol) | (tol - diff)) >> 63) & 1
+        return out
+    
+    return _verify_odds_kernel
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    """Normalize a team name for comparison (cached, interned)."""
+    return sys.intern(name.casefold().strip())
+
+
+# Canonical team name -> nicknames and slang that unambiguously refer to it
+_TEAM_ALIASES = {
+    "Golden State Warriors": ("warriors", "dubs", "gsw", "golden state"),
+    "Los Angeles Lakers": ("lakers", "la lakers", "lal"),
+    "Los Angeles Clippers": ("clippers", "la clippers", "clips", "lac"),
+    "Boston Celtics": ("celtics", "celts"),
+    "Philadelphia 76ers": ("76ers", "sixers"),
+    "Cleveland Cavaliers": ("cavaliers", "cavs"),
+    "Dallas Mavericks": ("mavericks", "mavs"),
+    "Minnesota Timberwolves": ("timberwolves", "wolves", "t-wolves"),
+    "Kansas City Chiefs": ("chiefs", "kc chiefs"),
+}
+
+# Normalized alias (and canonical name) -> canonical team name
+CANONICAL_ALIASES: Mapping[str, str] = MappingProxyType({
+    _normalize(name): canonical
+    for canonical, aliases in _TEAM_ALIASES.items()
+    for name in (canonical, *aliases)
+})
+
+
+def _build_alias_scanner():
+    """
+    Compile a multi-pattern matcher over every known alias.
+    
+    Returns a function mapping normalized text to the canonical team of
+    the longest alias found on word boundaries, or None.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for alias, canonical in CANONICAL_ALIASES.items():
+            automaton.add_word(alias, (len(alias), canonical))
+        automaton.make_automaton()
+        
+        def scan(text: str) -> Optional[str]:
+            best_length, best = 0, None
+            for end, (length, canonical) in automaton.iter(text):
+                start = end - length + 1
+                if (
+                    length > best_length
+                    and (start == 0 or not text[start - 1].isalnum())
+                    and (end + 1 == len(text) or not text[end + 1].isalnum())
+                ):
+                    best_length, best = length, canonical
+            return best
+        
+        return scan
+    
+    # [^\W_] is an alphanumeric character, the automaton's boundary rule;
+    # the lookahead reports overlapping matches like the automaton does
+    pattern = re.compile(
+        r"(?<![^\W_])(?=((?:"
+        + "|".join(map(re.escape, sorted(CANONICAL_ALIASES, key=len, reverse=True)))
+        + r")(?![^\W_])))"
+    )
+    
+    def scan(text: str) -> Optional[str]:
+        matches = [match.group(1) for match in pattern.finditer(text)]
+        return CANONICAL_ALIASES[max(matches, key=len)] if matches else None
+    
+    return scan
+
+
+# Normalized text -> canonical team of the longest alias it contains
+_scan_aliases = _build_alias_scanner()
+
+# rapidfuzz token_sort_ratio thresholds for names missing from the alias map
+# (only applied when the final nickname token matches exactly)
+_FUZZY_VERIFIED_SCORE = 95
+_FUZZY_PARTIAL_SCORE = 85
+
+
+class VerificationStatus(IntEnum):
+    """Result of verification check (values double as compact log codes)."""
+    VERIFIED = 0
+    FAILED = 1
+    PARTIAL = 2
+    SKIPPED = 3
+
+
+# Display names, indexed by VerificationStatus
+STATUS_NAMES: Tuple[str, ...] = ("verified", "failed", "partial", "skipped")
+
+
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
-    """Result of a single verification check."""
+    """
+    Result of a single verification check.
+    
+    Source and AI values are kept as given (e.g. Decimal odds) and only
+    formatted when read through source_value / ai_value. The timestamp
+    is epoch seconds (UTC); timestamp_dt converts it on demand.
+    """
     status: VerificationStatus
     claim: str
-    source_value: Optional[str]
-    ai_value: Optional[str]
+    source_raw: Any
+    ai_raw: Any
     discrepancy: Optional[str]
-    timestamp: datetime
+    timestamp: float
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Timestamp as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp, tz=timezone.utc)
+    
+    @property
+    def source_value(self) -> Optional[str]:
+        """Source value formatted for display."""
+        return None if self.source_raw is None else str(self.source_raw)
+    
+    @property
+    def ai_value(self) -> Optional[str]:
+        """AI-claimed value formatted for display."""
+        return None if self.ai_raw is None else str(self.ai_raw)
+
 
+# Shared result for exact odds matches; the full row lives in the audit log
+_VERIFIED_SENTINEL = VerificationResult(
+    status=VerificationStatus.VERIFIED,
+    claim="",
+    source_raw=None,
+    ai_raw=None,
+    discrepancy=None,
+    timestamp=0.0,
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AIPrediction:
     """An AI-generated prediction or insight."""
     event_id: str
@@ -49,29 +314,318 @@ class AIPrediction:
     generated_at: datetime
 
 
+# Status code -> member, for rebuilding results from the columnar log
+_STATUSES: Tuple[VerificationStatus, ...] = tuple(VerificationStatus)
+
+
+# Most distinct (claim, source, AI, discrepancy) tuples the log will share
+_INTERN_LIMIT = 65_536
+
+
+def _intern_key(value: Any) -> Any:
+    """Hashable key that only matches values with the same representation."""
+    if isinstance(value, Decimal):
+        # -110 and -110.0 are equal but keep different digits/exponents
+        return Decimal, value.as_tuple()
+    if isinstance(value, float):
+        return float, repr(value)
+    return type(value), value
+
+
+class VerificationLog:
+    """
+    Columnar audit log of verification results.
+    
+    Statuses (one byte each) and epoch timestamps are stored in contiguous
+    arrays. Claim details are hash-consed: identical (claim, source, AI,
+    discrepancy) rows share one tuple, so skewed workloads store each
+    distinct detail once. Values are matched by type and representation,
+    so Decimal("-110") and Decimal("-110.0") stay distinct. VerificationResult
+    objects are only materialized when an entry is read. Per-status
+    counts are kept up to date on insert.
+    
+    With maxlen set, only the most recent maxlen rows stay in memory
+    (counts still cover every row); an optional writer receives every
+    row for persistent audit.
+    """
+    
+    def __init__(self, maxlen: Optional[int] = None, writer: Optional["AuditWriter"] = None):
+        """
+        Args:
+            maxlen: Rows kept in memory (None for unbounded)
+            writer: Persistent sink receiving every row
+        """
+        self.maxlen = maxlen
+        self.writer = writer
+        # Rows before _start have been evicted and await compaction
+        self._start = 0
+        self._status = array("b")
+        self._ts = array("d")
+        self._detail: List[Tuple[str, Any, Any, Optional[str]]] = []
+        self._intern: dict = {}
+        self._counts = [0] * len(_STATUSES)
+    
+    def __len__(self) -> int:
+        return len(self._status) - self._start
+    
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[VerificationResult, List[VerificationResult]]:
+        """Materialize an entry, or a list of entries for a slice."""
+        size = len(self)
+        if isinstance(index, slice):
+            return [self._materialize(i + self._start) for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("verification log index out of range")
+        return self._materialize(index + self._start)
+    
+    def _materialize(self, index: int) -> VerificationResult:
+        """Build the VerificationResult stored at a raw storage index."""
+        claim, source_raw, ai_raw, discrepancy = self._detail[index]
+        return VerificationResult(
+            status=_STATUSES[self._status[index]],
+            claim=claim,
+            source_raw=source_raw,
+            ai_raw=ai_raw,
+            discrepancy=discrepancy,
+            timestamp=self._ts[index],
+        )
+    
+    def __iter__(self) -> Iterator[VerificationResult]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def append(self, result: VerificationResult) -> None:
+        """Store a single result."""
+        self.record(
+            result.status,
+            result.claim,
+            result.source_raw,
+            result.ai_raw,
+            result.discrepancy,
+            result.timestamp,
+        )
+    
+    def record(
+        self,
+        status: VerificationStatus,
+        claim: str,
+        source_raw: Any,
+        ai_raw: Any,
+        discrepancy: Optional[str],
+        timestamp: float
+    ) -> None:
+        """Store a single row without building a VerificationResult."""
+        self._status.append(status)
+        self._counts[status] += 1
+        self._ts.append(timestamp)
+        self._detail.append(self._shared_detail(claim, source_raw, ai_raw, discrepancy))
+        if self.writer is not None:
+            self.writer.write(status, timestamp, claim, source_raw, ai_raw, discrepancy)
+        if self.maxlen is not None:
+            self._evict()
+    
+    def extend(self, results: Iterable[VerificationResult]) -> None:
+        """Store several results."""
+        for result in results:
+            self.append(result)
+    
+    def append_columns(
+        self,
+        status_codes: np.ndarray,
+        timestamp: float,
+        claims: Sequence[str],
+        source_values: Sequence[Any],
+        ai_values: Sequence[Any],
+        discrepancies: Sequence[Optional[str]]
+    ) -> None:
+        """Store a batch of rows sharing one timestamp, column by column."""
+        codes = np.asarray(status_codes, dtype=np.int8)
+        self._status.frombytes(codes.tobytes())
+        for code, count in enumerate(np.bincount(codes, minlength=len(_STATUSES)).tolist()):
+            self._counts[code] += count
+        self._ts.extend([timestamp] * len(codes))
+        shared = self._shared_detail
+        self._detail.extend(
+            shared(*row) for row in zip(claims, source_values, ai_values, discrepancies)
+        )
+        if self.writer is not None:
+            for row in zip(codes.tolist(), claims, source_values, ai_values, discrepancies):
+                self.writer.write(row[0], timestamp, *row[1:])
+        if self.maxlen is not None:
+            self._evict()
+    
+    def _shared_detail(
+        self,
+        claim: str,
+        source_raw: Any,
+        ai_raw: Any,
+        discrepancy: Optional[str]
+    ) -> Tuple[str, Any, Any, Optional[str]]:
+        """Return the canonical detail tuple for a row, registering new ones."""
+        detail = (claim, source_raw, ai_raw, discrepancy)
+        try:
+            key = (claim, _intern_key(source_raw), _intern_key(ai_raw), discrepancy)
+            shared = self._intern.get(key)
+        except TypeError:  # Unhashable raw value - store it unshared
+            return detail
+        if shared is not None:
+            return shared
+        if len(self._intern) < _INTERN_LIMIT:
+            self._intern[key] = detail
+        return detail
+    
+    def _evict(self) -> None:
+        """Drop rows beyond maxlen, compacting storage once half is dead."""
+        excess = len(self) - self.maxlen
+        if excess <= 0:
+            return
+        self._start += excess
+        if self._start >= max(self.maxlen, 1):
+            for column in (self._status, self._ts, self._detail):
+                del column[:self._start]
+            self._start = 0
+    
+    def timestamps(self) -> np.ndarray:
+        """In-memory timestamps as datetime64[us] (UTC), converted in bulk."""
+        epoch = np.frombuffer(self._ts, dtype=np.float64)[self._start:]
+        # Round the fraction alone, as datetime.fromtimestamp does, so both
+        # views of a row agree to the microsecond
+        fraction, seconds = np.modf(epoch)
+        micros = seconds.astype(np.int64) * 1_000_000 + np.rint(fraction * 1e6).astype(np.int64)
+        return micros.astype("datetime64[us]")
+    
+    def status_counts(self) -> Tuple[int, ...]:
+        """Number of results logged per status code, including evicted rows."""
+        return tuple(self._counts)
+    
+    def close(self) -> None:
+        """Close the persistent writer, if any."""
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _check_team_name(claimed_team: str, source_team: str, timestamp: float) -> VerificationResult:
+    """Compare a claimed team name against the source (pure, no logging)."""
+    # Normalize for comparison (interned, so equal names are identical)
+    claimed_normalized = _normalize(claimed_team)
+    source_normalized = _normalize(source_team)
+    claimed_canonical = CANONICAL_ALIASES.get(claimed_normalized)
+    source_canonical = CANONICAL_ALIASES.get(source_normalized)
+    
+    if claimed_normalized is source_normalized or (
+        claimed_canonical is not None and claimed_canonical == source_canonical
+    ):
+        status = VerificationStatus.VERIFIED
+        discrepancy = None
+    elif claimed_canonical is not None and source_canonical is not None:
+        # Two different known teams - never soften this with substrings
+        status = VerificationStatus.FAILED
+        discrepancy = "Team name mismatch"
+    elif claimed_normalized in source_normalized or source_normalized in claimed_normalized:
+        status = VerificationStatus.PARTIAL
+        discrepancy = "Partial match - may be abbreviation"
+    elif source_canonical is not None and (
+        mentioned := _scan_aliases(claimed_normalized)
+    ) is not None:
+        # The claim mentions a known team inside a longer phrase
+        if mentioned == source_canonical:
+            status = VerificationStatus.PARTIAL
+            discrepancy = "Partial match - alias found in claim"
+        else:
+            status = VerificationStatus.FAILED
+            discrepancy = "Team name mismatch"
+    elif (
+        fuzz is not None
+        and claimed_canonical is None
+        and source_canonical is None
+        # The nickname must match exactly: a one-letter edit there is
+        # usually a different team ("Jets" vs "Mets"), not a typo
+        and claimed_normalized.rsplit(None, 1)[-1] == source_normalized.rsplit(None, 1)[-1]
+        and (score := fuzz.token_sort_ratio(claimed_normalized, source_normalized))
+        >= _FUZZY_PARTIAL_SCORE
+    ):
+        if score >= _FUZZY_VERIFIED_SCORE:
+            status = VerificationStatus.VERIFIED
+            discrepancy = None
+        else:
+            status = VerificationStatus.PARTIAL
+            discrepancy = f"Partial match - fuzzy score {score:.0f}"
+    else:
+        status = VerificationStatus.FAILED
+        discrepancy = "Team name mismatch"
+    
+    return VerificationResult(
+        status=status,
+        claim="Team name",
+        source_raw=source_team,
+        ai_raw=claimed_team,
+        discrepancy=discrepancy,
+        timestamp=timestamp,
+    )
+
+
 class TrustLayerValidator:
     """
     Validates AI outputs against verified source data.
     
     The Trust Layer sits between the AI and the user interface.
     No AI output reaches the display without passing verification.
+    
+    A validator is not thread-safe: its log must be written from one
+    thread.
     """
     
-    def __init__(self, tolerance: Decimal = Decimal("0.01")):
+    def __init__(
+        self,
+        tolerance: Decimal = Decimal("0.01"),
+        fail_fast: bool = True,
+        max_log_in_memory: Optional[int] = 100_000,
+        audit_writer: Optional["AuditWriter"] = None
+    ):
         """
         Initialize validator.
         
         Args:
             tolerance: Acceptable deviation for numeric comparisons
+            fail_fast: Stop verify_prediction at the first failed team check.
+                Set to False (strict mode) to always run every check, e.g.
+                for audit reports that want the full list of discrepancies.
+            max_log_in_memory: Most recent log rows kept in memory
+                (None for unbounded); the summary still counts every check
+            audit_writer: Persistent sink for every logged row, e.g. one
+                of the writers in trust_layer.audit
         """
         self.tolerance = tolerance
-        self.verification_log: List[VerificationResult] = []
+        self.fail_fast = fail_fast
+        self.verification_log = VerificationLog(maxlen=max_log_in_memory, writer=audit_writer)
+    
+    @property
+    def tolerance(self) -> Decimal:
+        """Acceptable deviation for numeric comparisons."""
+        return self._tolerance
+    
+    @tolerance.setter
+    def tolerance(self, value: Decimal) -> None:
+        value = _as_decimal(value)
+        if not value.is_finite() or value < 0:
+            raise ValueError(f"Tolerance must be finite and non-negative, got {value}")
+        scaled = value.scaleb(_ODDS_SCALE_EXPONENT)
+        self._tolerance = value
+        self._classify_odds = _specialize_odds_check(scaled)
+        # Batch odds are whole fixed-point units, so flooring the tolerance
+        # gives the same verdicts; capped so diff +/- tol stays in int64
+        self._batch_tol_scaled = min(int(scaled), 2 * _SCALED_LIMIT - 1)
     
     def verify_odds_claim(
         self, 
         claimed_odds: Decimal, 
         source_odds: Decimal,
-        selection: str
+        selection: str,
+        _ts: Optional[float] = None
     ) -> VerificationResult:
         """
         Verify AI's claimed odds match source data.
@@ -80,70 +634,221 @@ class TrustLayerValidator:
             claimed_odds: What the AI said the odds are
             source_odds: What the verified data source shows
             selection: The team/outcome being checked
+            _ts: Epoch timestamp shared with a parent check (defaults to now)
         
         Returns:
-            VerificationResult with status and details
+            VerificationResult with status and details. Exact matches
+            return a shared VERIFIED result without details; the full
+            row is still written to the audit log.
         """
-        diff = abs(claimed_odds - source_odds)
+        timestamp = time.time() if _ts is None else _ts
+        claimed_odds = _as_decimal(claimed_odds)
+        source_odds = _as_decimal(source_odds)
+        if claimed_odds.is_finite() and source_odds.is_finite():
+            outcome = self._classify_odds(claimed_odds, source_odds)
+        else:
+            outcome = _ODDS_INVALID
+        
+        if outcome == _ODDS_EXACT:
+            self.verification_log.record(
+                VerificationStatus.VERIFIED,
+                f"Odds for {selection}",
+                source_odds,
+                claimed_odds,
+                None,
+                timestamp,
+            )
+            return _VERIFIED_SENTINEL
         
-        if diff <= self.tolerance:
+        if outcome == _ODDS_WITHIN:
             result = VerificationResult(
                 status=VerificationStatus.VERIFIED,
                 claim=f"Odds for {selection}",
-                source_value=str(source_odds),
-                ai_value=str(claimed_odds),
+                source_raw=source_odds,
+                ai_raw=claimed_odds,
                 discrepancy=None,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=timestamp,
             )
         else:
             result = VerificationResult(
                 status=VerificationStatus.FAILED,
                 claim=f"Odds for {selection}",
-                source_value=str(source_odds),
-                ai_value=str(claimed_odds),
-                discrepancy=f"Difference of {diff} exceeds tolerance {self.tolerance}",
-                timestamp=datetime.now(timezone.utc),
+                source_raw=source_odds,
+                ai_raw=claimed_odds,
+                discrepancy=(
+                    f"Difference of {abs(claimed_odds - source_odds)} "
+                    f"exceeds tolerance {self.tolerance}"
+                    if outcome == _ODDS_OUTSIDE else _INVALID_ODDS_DISCREPANCY
+                ),
+                timestamp=timestamp,
             )
         
         self.verification_log.append(result)
         return result
     
+    def verify_predictions_batch(
+        self,
+        claimed: np.ndarray,
+        source: np.ndarray,
+        selections: np.ndarray
+    ) -> Tuple[np.ndarray, List[VerificationResult]]:
+        """
+        Verify many claimed odds against source odds in one vectorized pass.
+        
+        Odds are compared as int64 fixed-point (x1000) so the tolerance
+        check stays exact without per-row Decimal arithmetic.
+        
+        Args:
+            claimed: What the AI said the odds are, one per selection
+            source: What the verified data source shows
+            selections: The team/outcome being checked in each row
+        
+        Returns:
+            Tuple of (boolean pass mask, results for the failing rows).
+            Every row, passing or not, is written to the audit log.
+        """
+        if np.shape(selections) != np.shape(claimed):
+            raise ValueError("claimed, source and selections must have the same shape")
+        
+        claimed_scaled, claimed_valid = _to_scaled_array(claimed)
+        source_scaled, source_valid = _to_scaled_array(source)
+        valid = claimed_valid & source_valid
+        status_codes = self._run_odds_kernel(claimed_scaled, source_scaled, valid)
+        passed = status_codes == VerificationStatus.VERIFIED
+        timestamp = time.time()
+        
+        # Only the failing minority is materialized as VerificationResult
+        failed_rows = np.flatnonzero(~passed).tolist()
+        failures = [
+            VerificationResult(
+                status=VerificationStatus.FAILED,
+                claim=f"Odds for {selections[i]}",
+                source_raw=source[i],
+                ai_raw=claimed[i],
+                discrepancy=(
+                    f"Difference of "
+                    f"{Decimal(abs(int(claimed_scaled[i]) - int(source_scaled[i]))) / _ODDS_SCALE} "
+                    f"exceeds tolerance {self.tolerance}"
+                    if valid[i] else _INVALID_ODDS_DISCREPANCY
+                ),
+                timestamp=timestamp,
+            )
+            for i in failed_rows
+        ]
+        
+        # Every row still lands in the audit log, written column-wise
+        discrepancies: List[Optional[str]] = [None] * len(passed)
+        for i, result in zip(failed_rows, failures):
+            discrepancies[i] = result.discrepancy
+        self.verification_log.append_columns(
+            status_codes=status_codes,
+            timestamp=timestamp,
+            claims=[f"Odds for {selection}" for selection in selections],
+            source_values=list(source),
+            ai_values=list(claimed),
+            discrepancies=discrepancies,
+        )
+        return passed, failures
+    
+    def verify_odds_batch(
+        self,
+        claimed_arr: np.ndarray,
+        source_arr: np.ndarray,
+        *,
+        parallel: bool = True,
+        boundscheck: bool = False
+    ) -> np.ndarray:
+        """
+        Compute status codes for many odds claims with a compiled kernel.
+        
+        Uses numba when installed, plain numpy otherwise. Nothing is
+        written to the audit log; use verify_predictions_batch for that.
+        
+        Args:
+            claimed_arr: 1-D array of AI-claimed odds
+            source_arr: 1-D array of verified source odds
+            parallel: Spread rows across cores (numba only)
+            boundscheck: Enable index bounds checks for debugging (numba only)
+        
+        Returns:
+            int8 array of status codes (0 = VERIFIED, 1 = FAILED); rows
+            with a missing, non-finite or out-of-range value are always FAILED
+        """
+        claimed_scaled, claimed_valid = _to_scaled_array(claimed_arr)
+        source_scaled, source_valid = _to_scaled_array(source_arr)
+        return self._run_odds_kernel(
+            claimed_scaled,
+            source_scaled,
+            claimed_valid & source_valid,
+            parallel=parallel,
+            boundscheck=boundscheck,
+        )
+    
+    def _run_odds_kernel(
+        self,
+        claimed_scaled: np.ndarray,
+        source_scaled: np.ndarray,
+        valid: np.ndarray,
+        parallel: bool = True,
+        boundscheck: bool = False
+    ) -> np.ndarray:
+        """Run the odds kernel on already-scaled 1-D arrays, failing invalid rows."""
+        if claimed_scaled.ndim != 1 or claimed_scaled.shape != source_scaled.shape:
+            raise ValueError("claimed and source must be 1-D arrays of the same length")
+        kernel = _compile_odds_kernel(parallel=parallel, boundscheck=boundscheck)
+        status_codes = kernel(claimed_scaled, source_scaled, self._batch_tol_scaled)
+        status_codes[~valid] = VerificationStatus.FAILED
+        return status_codes
+    
     def verify_team_name(
         self, 
         claimed_team: str, 
-        source_team: str
+        source_team: str,
+        _ts: Optional[float] = None
     ) -> VerificationResult:
         """
         Verify AI's team name matches source.
         
-        Catches hallucinated team names.
+        Catches hallucinated team names. Known aliases ("Dubs") resolve
+        to their canonical team; unknown names fall back to substring and
+        fuzzy matching.
         """
-        # Normalize for comparison
-        claimed_normalized = claimed_team.lower().strip()
-        source_normalized = source_team.lower().strip()
-        
-        if claimed_normalized == source_normalized:
-            status = VerificationStatus.VERIFIED
-            discrepancy = None
-        elif claimed_normalized in source_normalized or source_normalized in claimed_normalized:
-            status = VerificationStatus.PARTIAL
-            discrepancy = "Partial match - may be abbreviation"
-        else:
-            status = VerificationStatus.FAILED
-            discrepancy = "Team name mismatch"
-        
-        result = VerificationResult(
-            status=status,
-            claim="Team name",
-            source_value=source_team,
-            ai_value=claimed_team,
-            discrepancy=discrepancy,
-            timestamp=datetime.now(timezone.utc),
+        result = _check_team_name(
+            claimed_team, source_team, time.time() if _ts is None else _ts
         )
-        
         self.verification_log.append(result)
         return result
     
+    @staticmethod
+    def _verify_one(
+        fail_fast: bool,
+        prediction: AIPrediction,
+        source_team: str,
+        timestamp: float
+    ) -> List[VerificationResult]:
+        """
+        Run the prediction checks without touching validator state.
+        
+        The first result is always the team check. Safe to call from
+        worker threads; the caller is responsible for logging.
+        """
+        team_result = _check_team_name(prediction.predicted_value, source_team, timestamp)
+        results = [team_result]
+        if team_result.status is VerificationStatus.FAILED and fail_fast:
+            return results
+        
+        # Check confidence is reasonable
+        if prediction.confidence > 1.0 or prediction.confidence < 0:
+            results.append(VerificationResult(
+                status=VerificationStatus.FAILED,
+                claim="Confidence score",
+                source_raw="0.0-1.0",
+                ai_raw=prediction.confidence,
+                discrepancy="Confidence out of valid range",
+                timestamp=timestamp,
+            ))
+        return results
+    
     def verify_prediction(
         self, 
         prediction: AIPrediction,
@@ -153,37 +858,57 @@ class TrustLayerValidator:
         """
         Run full verification suite on an AI prediction.
         
+        With fail_fast enabled, a failed team check rejects the prediction
+        without running the remaining checks.
+        
         Returns:
             Tuple of (all_passed, list of results)
         """
-        results = []
-        
-        # Verify team name
-        team_result = self.verify_team_name(
-            claimed_team=prediction.predicted_value,
-            source_team=source_team
+        results = self._verify_one(
+            self.fail_fast, prediction, source_team, time.time()
         )
-        results.append(team_result)
-        
-        # Check confidence is reasonable
-        if prediction.confidence > 1.0 or prediction.confidence < 0:
-            results.append(VerificationResult(
-                status=VerificationStatus.FAILED,
-                claim="Confidence score",
-                source_value="0.0-1.0",
-                ai_value=str(prediction.confidence),
-                discrepancy="Confidence out of valid range",
-                timestamp=datetime.now(timezone.utc),
-            ))
+        self.verification_log.append(results[0])
         
-        all_passed = all(r.status == VerificationStatus.VERIFIED for r in results)
+        all_passed = all(r.status is VerificationStatus.VERIFIED for r in results)
         return all_passed, results
     
+    def verify_predictions(
+        self,
+        items: Iterable[Tuple[AIPrediction, Decimal, str]]
+    ) -> List[Tuple[bool, List[VerificationResult]]]:
+        """
+        Verify many predictions in one pass.
+        
+        Each item is (prediction, source_odds, source_team), as passed to
+        verify_prediction. The checks are pure-Python string work, so they
+        run serially in the calling thread; the batch saves the per-call
+        timestamp and log append by sharing one timestamp and logging
+        every team result in a single extend.
+        
+        Returns:
+            (all_passed, results) per item, in input order
+        """
+        check = functools.partial(
+            self._verify_one, self.fail_fast, timestamp=time.time()
+        )
+        outcomes = [check(prediction, source_team) for prediction, _, source_team in items]
+        
+        self.verification_log.extend(results[0] for results in outcomes)
+        return [
+            (all(r.status is VerificationStatus.VERIFIED for r in results), results)
+            for results in outcomes
+        ]
+    
+    def close(self) -> None:
+        """Flush and close the persistent audit writer, if any."""
+        self.verification_log.close()
+    
     def get_verification_summary(self) -> dict:
         """Get summary of all verifications performed."""
-        total = len(self.verification_log)
-        verified = sum(1 for r in self.verification_log if r.status == VerificationStatus.VERIFIED)
-        failed = sum(1 for r in self.verification_log if r.status == VerificationStatus.FAILED)
+        counts = self.verification_log.status_counts()
+        total = sum(counts)
+        verified = counts[VerificationStatus.VERIFIED]
+        failed = counts[VerificationStatus.FAILED]
         
         return {
             "total_checks": total,
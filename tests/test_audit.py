@@ -0,0 +1,125 @@
+"""
+Unit tests for the persistent audit writers.
+"""
+
+import json
+import pytest
+import numpy as np
+from decimal import Decimal
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from trust_layer.validator import TrustLayerValidator, VerificationStatus
+
+
+class TestArrowAuditWriter:
+    """Tests for the Arrow IPC audit stream."""
+    
+    def test_rows_round_trip(self, tmp_path):
+        """Should persist every row, including ones evicted from memory."""
+        pa = pytest.importorskip("pyarrow")
+        from trust_layer.audit import ArrowAuditWriter
+        
+        path = tmp_path / "audit.arrows"
+        validator = TrustLayerValidator(
+            max_log_in_memory=2,
+            audit_writer=ArrowAuditWriter(str(path), batch_size=2),
+        )
+        validator.verify_odds_claim(Decimal("-110"), Decimal("-110"), "Warriors")
+        validator.verify_odds_claim(Decimal("+200"), Decimal("-500"), "Lakers")
+        validator.verify_team_name("Dubs", "Golden State Warriors")
+        validator.verify_predictions_batch(
+            claimed=np.array([-110.0]),
+            source=np.array([-110.0]),
+            selections=np.array(["Warriors"]),
+        )
+        validator.close()
+        
+        with pa.ipc.open_stream(str(path)) as reader:
+            table = reader.read_all()
+        
+        assert table.num_rows == 4
+        assert table.column("status").to_pylist() == [
+            VerificationStatus.VERIFIED,
+            VerificationStatus.FAILED,
+            VerificationStatus.VERIFIED,
+            VerificationStatus.VERIFIED,
+        ]
+        assert table.column("source_odds").to_pylist() == [-110_000, -500_000, None, -110_000]
+        assert table.column("source_text").to_pylist() == [None, None, "Golden State Warriors", None]
+        assert table.column("ai_text").to_pylist()[2] == "Dubs"
+
+    def test_refuses_existing_file(self, tmp_path):
+        """Should not truncate audit history left by an earlier run."""
+        pytest.importorskip("pyarrow")
+        from trust_layer.audit import ArrowAuditWriter
+        
+        path = tmp_path / "audit.arrows"
+        path.write_bytes(b"earlier run")
+        
+        with pytest.raises(FileExistsError):
+            ArrowAuditWriter(str(path))
+        assert path.read_bytes() == b"earlier run"
+
+
+class TestOddsEncoding:
+    """Tests for the value encoding shared by every writer."""
+    
+    def test_numeric_values_are_fixed_point(self):
+        """Should encode every numeric type alike and keep text unchanged."""
+        from trust_layer.audit import _encode_odds
+        
+        assert {
+            _encode_odds(v) for v in (Decimal("-115"), -115, -115.0, np.float64(-115.0), np.int64(-115))
+        } == {-115_000}
+        assert _encode_odds(float("nan")) is None
+        assert _encode_odds("Lakers") == "Lakers"
+        assert _encode_odds(Decimal("1e30")) == "1E+30"
+
+
+class TestBinaryAuditWriters:
+    """Tests for the JSON-lines and msgpack audit writers."""
+    
+    @staticmethod
+    def _run(writer):
+        validator = TrustLayerValidator(audit_writer=writer)
+        validator.verify_odds_claim(Decimal("+200"), Decimal("-500"), "Lakers")
+        validator.verify_predictions_batch(
+            claimed=np.array([-110.0]),
+            source=np.array([-110.0]),
+            selections=np.array(["Warriors"]),
+        )
+        validator.close()
+    
+    def test_jsonl_rows_use_scaled_odds(self, tmp_path):
+        """Should write Decimal and float odds alike as int fixed-point."""
+        from trust_layer.audit import JsonlAuditWriter
+        
+        path = tmp_path / "audit.jsonl"
+        self._run(JsonlAuditWriter(str(path)))
+        
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert rows[0]["s"] == VerificationStatus.FAILED
+        assert rows[0]["sv"] == -500_000
+        assert rows[0]["av"] == 200_000
+        assert rows[1]["c"] == "Odds for Warriors"
+        assert rows[1]["sv"] == -110_000
+        assert rows[1]["av"] == -110_000
+
+    def test_msgpack_rows_carry_schema(self, tmp_path):
+        """Should prefix every msgpack row with the schema ID."""
+        msgpack = pytest.importorskip("msgpack")
+        from trust_layer.audit import MSGPACK_ROW_SCHEMA, MsgpackAuditWriter
+        
+        path = tmp_path / "audit.msgpack"
+        self._run(MsgpackAuditWriter(str(path)))
+        
+        with open(path, "rb") as stream:
+            rows = list(msgpack.Unpacker(stream))
+        assert [row[0] for row in rows] == [MSGPACK_ROW_SCHEMA] * 2
+        assert rows[0][4] == -500_000
+        assert rows[1][4] == -110_000
+        assert rows[0][6] == "Difference of 700 exceeds tolerance 0.01"
@@ -0,0 +1,353 @@
+"""
+Unit tests for bulk verification paths of the Trust Layer.
+
+Covers:
+- Vectorized odds tolerance checks
+- Audit log bookkeeping for batches
+"""
+
+import dataclasses
+import pytest
+import numpy as np
+from decimal import Decimal
+import sys
+import warnings
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from trust_layer.validator import (
+    TrustLayerValidator,
+    VerificationLog,
+    VerificationStatus,
+    _compile_odds_kernel,
+    _verify_odds_numpy,
+)
+
+
+class TestBatchOddsVerification:
+    """Tests for verify_predictions_batch."""
+    
+    def test_tolerance_boundary_is_exact(self):
+        """Should accept diffs equal to tolerance despite float inputs."""
+        validator = TrustLayerValidator(tolerance=Decimal("0.01"))
+        
+        passed, failures = validator.verify_predictions_batch(
+            claimed=np.array([-150.01, -150.02, 200.0]),
+            source=np.array([-150.0, -150.0, 200.0]),
+            selections=np.array(["Warriors", "Lakers", "Celtics"]),
+        )
+        
+        assert passed.tolist() == [True, False, True]
+        assert len(failures) == 1
+        assert failures[0].claim == "Odds for Lakers"
+        assert failures[0].status == VerificationStatus.FAILED
+
+    def test_batch_is_logged(self):
+        """Should log every row of the batch in input order."""
+        validator = TrustLayerValidator()
+        
+        validator.verify_predictions_batch(
+            claimed=np.array([Decimal("-110"), Decimal("+200")], dtype=object),
+            source=np.array([Decimal("-110"), Decimal("-500")], dtype=object),
+            selections=np.array(["Warriors", "Lakers"]),
+        )
+        
+        summary = validator.get_verification_summary()
+        assert summary["total_checks"] == 2
+        assert summary["verified"] == 1
+        assert summary["failed"] == 1
+        assert "700" in validator.verification_log[1].discrepancy
+
+    def test_non_finite_values_fail(self):
+        """Should never verify NaN, missing or infinite odds."""
+        validator = TrustLayerValidator()
+        
+        passed, failures = validator.verify_predictions_batch(
+            claimed=np.array([np.nan, np.inf, None, -110.0], dtype=object),
+            source=np.array([np.nan, np.inf, -110.0, np.nan], dtype=object),
+            selections=np.array(["A", "B", "C", "D"]),
+        )
+        
+        assert passed.tolist() == [False, False, False, False]
+        assert all("non-finite" in r.discrepancy for r in failures)
+
+    def test_out_of_range_values_fail(self):
+        """Should fail odds too large for int64 fixed-point instead of wrapping."""
+        validator = TrustLayerValidator()
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            passed, failures = validator.verify_predictions_batch(
+                claimed=np.array([1e17, 1e300]),
+                source=np.array([-1e17, -1e300]),
+                selections=np.array(["A", "B"]),
+            )
+        
+        assert passed.tolist() == [False, False]
+        assert [r.discrepancy for r in failures] == ["Missing or non-finite odds value"] * 2
+
+
+class TestScalarOddsVerification:
+    """Tests for the fixed-point verify_odds_claim path."""
+    
+    def test_matches_decimal_semantics(self):
+        """Should agree with exact Decimal comparison at the boundary."""
+        validator = TrustLayerValidator(tolerance=Decimal("0.5"))
+        
+        ok = validator.verify_odds_claim(Decimal("-110.5"), Decimal("-110"), "Warriors")
+        bad = validator.verify_odds_claim(Decimal("-110.501"), Decimal("-110"), "Warriors")
+        
+        assert ok.status == VerificationStatus.VERIFIED
+        assert bad.status == VerificationStatus.FAILED
+        assert bad.discrepancy == "Difference of 0.501 exceeds tolerance 0.5"
+
+    def test_sub_scale_odds_stay_exact(self):
+        """Should not round odds finer than the fixed-point scale."""
+        validator = TrustLayerValidator(tolerance=Decimal("0.001"))
+        
+        near = validator.verify_odds_claim(Decimal("-110.0004"), Decimal("-110"), "Warriors")
+        over = validator.verify_odds_claim(Decimal("-110.0014"), Decimal("-110"), "Warriors")
+        
+        assert near.status == VerificationStatus.VERIFIED
+        assert near.ai_raw == Decimal("-110.0004")
+        assert over.status == VerificationStatus.FAILED
+
+    def test_tolerance_finer_than_scale(self):
+        """Should apply sub-scale tolerances exactly and floor them for batches."""
+        validator = TrustLayerValidator(tolerance=Decimal("0.0001"))
+        
+        within = validator.verify_odds_claim(Decimal("-110.0001"), Decimal("-110"), "Warriors")
+        over = validator.verify_odds_claim(Decimal("-110.0002"), Decimal("-110"), "Warriors")
+        assert within.status == VerificationStatus.VERIFIED
+        assert over.status == VerificationStatus.FAILED
+        assert validator.verify_odds_batch(
+            np.array([-110.0, -110.001]), np.array([-110.0, -110.0])
+        ).tolist() == [VerificationStatus.VERIFIED, VerificationStatus.FAILED]
+        with pytest.raises(ValueError):
+            TrustLayerValidator(tolerance=Decimal("-0.01"))
+
+    def test_accepts_int_and_float_odds(self):
+        """Should coerce plain numbers like the Decimal path did."""
+        validator = TrustLayerValidator()
+        
+        assert validator.verify_odds_claim(-110, -110, "Warriors").status == VerificationStatus.VERIFIED
+        assert validator.verify_odds_claim(-110.5, -110, "Warriors").status == VerificationStatus.FAILED
+        with pytest.raises(TypeError):
+            validator.verify_odds_claim(object(), -110, "Warriors")
+
+    def test_non_finite_odds_fail(self):
+        """Should fail and log NaN or infinite odds like the batch path."""
+        validator = TrustLayerValidator()
+        
+        nan = validator.verify_odds_claim(Decimal("NaN"), Decimal("-110"), "Warriors")
+        inf = validator.verify_odds_claim(float("inf"), float("inf"), "Lakers")
+        _, failures = validator.verify_predictions_batch(
+            claimed=np.array([np.nan]),
+            source=np.array([-110.0]),
+            selections=np.array(["Warriors"]),
+        )
+        
+        assert nan.status == inf.status == VerificationStatus.FAILED
+        assert nan.discrepancy == inf.discrepancy == failures[0].discrepancy
+        assert validator.get_verification_summary()["failed"] == 3
+
+    def test_accepts_numpy_scalar_odds(self):
+        """Should coerce numpy ints and floats, including values from a batch failure."""
+        validator = TrustLayerValidator()
+        
+        assert validator.verify_odds_claim(
+            np.int64(-110), np.int64(-110), "Warriors"
+        ).status == VerificationStatus.VERIFIED
+        assert validator.verify_odds_claim(
+            np.float64(-110.5), np.float64(-110.0), "Warriors"
+        ).status == VerificationStatus.FAILED
+        
+        _, failures = validator.verify_predictions_batch(
+            claimed=np.array([-110.5]),
+            source=np.array([-110.0]),
+            selections=np.array(["Warriors"]),
+        )
+        replay = validator.verify_odds_claim(failures[0].ai_raw, failures[0].source_raw, "Warriors")
+        assert replay.status == VerificationStatus.FAILED
+
+    def test_tolerance_update_is_applied(self):
+        """Should honour a tolerance changed after construction."""
+        validator = TrustLayerValidator()
+        validator.tolerance = Decimal("5")
+        
+        result = validator.verify_odds_claim(Decimal("-115"), Decimal("-110"), "Lakers")
+        assert result.status == VerificationStatus.VERIFIED
+
+
+class TestVerificationLog:
+    """Tests for the columnar audit log."""
+    
+    def test_entries_round_trip(self):
+        """Should materialize logged entries with their original details."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_odds_claim(Decimal("-110"), Decimal("-115"), "Warriors")
+        logged = validator.verification_log[0]
+        
+        assert len(validator.verification_log) == 1
+        assert logged.status == VerificationStatus.FAILED
+        assert logged.source_raw == Decimal("-115")
+        assert logged.discrepancy == result.discrepancy
+        assert logged.timestamp == result.timestamp
+        assert logged.timestamp_dt.tzinfo is not None
+        assert validator.verification_log.timestamps()[0] == np.datetime64(
+            logged.timestamp_dt.replace(tzinfo=None), "us"
+        )
+
+    def test_summary_counts_statuses(self):
+        """Should count verified and failed checks in the summary."""
+        validator = TrustLayerValidator()
+        
+        validator.verify_team_name("Dubs", "Golden State Warriors")
+        validator.verify_team_name("Denver", "Denver Nuggets")
+        validator.verify_odds_claim(Decimal("+200"), Decimal("-500"), "Lakers")
+        
+        summary = validator.get_verification_summary()
+        assert summary == {
+            "total_checks": 3,
+            "verified": 1,
+            "failed": 1,
+            "pass_rate": 1 / 3,
+        }
+
+    def test_equal_decimals_keep_their_representation(self):
+        """Should not share details between -110 and -110.0."""
+        validator = TrustLayerValidator()
+        
+        validator.verify_odds_claim(Decimal("-110"), Decimal("-110"), "Warriors")
+        validator.verify_odds_claim(Decimal("-110.0"), Decimal("-110.0"), "Warriors")
+        first, second = validator.verification_log[:]
+        
+        assert str(first.source_raw) == "-110"
+        assert str(second.source_raw) == "-110.0"
+        assert second.source_value == "-110.0"
+
+    def test_bulk_timestamps_match_datetimes(self):
+        """Should round bulk timestamps the same way timestamp_dt does."""
+        log = VerificationLog()
+        # rint(epoch * 1e6) lands one microsecond off for this value
+        log.record(VerificationStatus.VERIFIED, "claim", None, None, None, 1760763774.6189766)
+        
+        assert log.timestamps()[0] == np.datetime64(
+            log[0].timestamp_dt.replace(tzinfo=None), "us"
+        )
+
+    def test_slice_returns_recent_entries(self):
+        """Should materialize a slice of the log as a list of results."""
+        validator = TrustLayerValidator(max_log_in_memory=4)
+        
+        for offset in range(6):
+            validator.verify_odds_claim(Decimal(-110 - offset), Decimal("-110"), f"Game {offset}")
+        tail = validator.verification_log[-2:]
+        
+        assert [r.claim for r in tail] == ["Odds for Game 4", "Odds for Game 5"]
+        assert validator.verification_log[::-1][0].claim == "Odds for Game 5"
+        assert validator.verification_log[10:] == []
+
+    def test_bounded_log_keeps_recent_rows(self):
+        """Should keep only the newest rows but count every check."""
+        validator = TrustLayerValidator(max_log_in_memory=3)
+        
+        for odds in range(100, 110):
+            validator.verify_odds_claim(Decimal(odds), Decimal(100), f"Team {odds}")
+        
+        log = validator.verification_log
+        assert len(log) == 3
+        assert [r.claim for r in log] == ["Odds for Team 107", "Odds for Team 108", "Odds for Team 109"]
+        assert log[-1].claim == "Odds for Team 109"
+        assert validator.get_verification_summary()["total_checks"] == 10
+        assert validator.get_verification_summary()["verified"] == 1
+
+
+class TestOddsKernel:
+    """Tests for the compiled verify_odds_batch kernel."""
+    
+    def test_status_codes(self):
+        """Should return 0 for verified rows and 1 for failed rows."""
+        validator = TrustLayerValidator(tolerance=Decimal("0.5"))
+        
+        codes = validator.verify_odds_batch(
+            np.array([-110.0, -110.5, -111.0, 150.0]),
+            np.array([-110.0, -110.0, -110.0, -150.0]),
+        )
+        
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [0, 0, 1, 1]
+        assert len(validator.verification_log) == 0
+
+    def test_debug_flags_match(self):
+        """Should give the same answer with debug jit flags."""
+        validator = TrustLayerValidator()
+        claimed = np.linspace(-200.0, 200.0, 101)
+        source = claimed + 0.005
+        
+        fast = validator.verify_odds_batch(claimed, source)
+        debug = validator.verify_odds_batch(claimed, source, parallel=False, boundscheck=True)
+        assert fast.tolist() == debug.tolist()
+
+    def test_numpy_fallback_matches_kernel(self):
+        """Should give the same codes with and without numba."""
+        validator = TrustLayerValidator(tolerance=Decimal("0.5"))
+        claimed = np.array([-110000, -110500, -111000, 150000, np.iinfo(np.int64).min])
+        source = np.array([-110000, -110000, -110000, -150000, 0])
+        
+        fallback = _verify_odds_numpy(claimed, source, validator._batch_tol_scaled)
+        kernel = _compile_odds_kernel()(claimed, source, validator._batch_tol_scaled)
+        
+        assert fallback.dtype == np.int8
+        assert fallback.tolist() == kernel.tolist() == [0, 0, 1, 1, 1]
+
+    def test_non_finite_values_fail(self):
+        """Should fail NaN and infinite rows on the public batch path."""
+        validator = TrustLayerValidator()
+        
+        codes = validator.verify_odds_batch(
+            np.array([np.nan, np.inf, -110.0]),
+            np.array([0.0, np.inf, -110.0]),
+        )
+        assert codes.tolist() == [1, 1, 0]
+
+
+class TestImmutableResults:
+    """Tests for frozen result records."""
+    
+    def test_result_is_frozen_and_hashable(self):
+        """Should reject mutation and allow use as a dict key."""
+        validator = TrustLayerValidator()
+        result = validator.verify_team_name("Dubs", "Golden State Warriors")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.status = VerificationStatus.FAILED
+        assert {result: True}[result]
+
+    def test_exact_match_shares_result(self):
+        """Should reuse one VERIFIED result for exact matches but log each."""
+        validator = TrustLayerValidator()
+        
+        first = validator.verify_odds_claim(Decimal("-110"), Decimal("-110"), "Warriors")
+        second = validator.verify_odds_claim(Decimal("+130"), Decimal("+130"), "Lakers")
+        
+        assert first is second
+        assert first.status == VerificationStatus.VERIFIED
+        assert validator.verification_log[1].claim == "Odds for Lakers"
+        assert validator.verification_log[1].ai_raw == Decimal("130")
+
+    def test_identical_rows_share_details(self):
+        """Should store repeated identical checks as one shared detail."""
+        validator = TrustLayerValidator()
+        
+        for _ in range(3):
+            validator.verify_team_name("Dubs", "Golden State Warriors")
+        validator.verify_team_name("Denver", "Denver Nuggets")
+        
+        log = validator.verification_log
+        assert log._detail[0] is log._detail[1] is log._detail[2]
+        assert log._detail[3] is not log._detail[0]
+        assert [r.ai_raw for r in log] == ["Dubs", "Dubs", "Dubs", "Denver"]
@@ -0,0 +1,138 @@
+"""
+Unit tests for the odds data schemas.
+
+Covers:
+- Trusted and batch ingest of odds lines
+- Snapshot-level implied probabilities
+- Event lookup
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime, timezone
+import sys
+from pathlib import Path
+
+from pydantic import ValidationError
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from schemas.odds import Event, Market, OddsFormat, OddsLine, OddsSnapshot
+
+
+class TestOddsLineIngest:
+    """Tests for OddsLine construction paths."""
+    
+    def test_from_trusted_skips_validation(self):
+        """Should build a line without running validators."""
+        line = OddsLine.from_trusted(selection="Warriors", odds=Decimal("-150"))
+        
+        assert line.odds == Decimal("-150")
+        assert line.odds_format == OddsFormat.AMERICAN
+        assert line.implied_probability is None
+
+    def test_validate_many(self):
+        """Should validate and coerce a batch of raw lines."""
+        lines = OddsLine.validate_many([
+            {"selection": "Warriors", "odds": "-150"},
+            {"selection": "Lakers", "odds": 130},
+        ])
+        
+        assert [line.odds for line in lines] == [Decimal("-150"), Decimal("130")]
+
+    def test_validate_many_rejects_bad_odds(self):
+        """Should still reject invalid American odds in a batch."""
+        with pytest.raises(ValidationError):
+            OddsLine.validate_many([{"selection": "Lakers", "odds": "50"}])
+
+
+def _snapshot(lines):
+    now = datetime.now(timezone.utc)
+    market = Market(market_id="m1", market_type="moneyline", lines=lines, last_updated=now)
+    event = Event(
+        event_id="evt_1",
+        sport="basketball",
+        league="NBA",
+        home_team="Golden State Warriors",
+        away_team="Los Angeles Lakers",
+        start_time=now,
+        markets=[market],
+    )
+    return OddsSnapshot(provider="test", captured_at=now, events=[event])
+
+
+class TestImpliedProbabilities:
+    """Tests for OddsSnapshot.compute_implied_probabilities."""
+    
+    def test_matches_per_line_calculation(self):
+        """Should agree with OddsLine.calculate_implied_probability."""
+        lines = [
+            OddsLine(selection="Warriors", odds=Decimal("-150")),
+            OddsLine(selection="Lakers", odds=Decimal("130")),
+            OddsLine.from_trusted(
+                selection="Draw", odds=Decimal("2.5"), odds_format=OddsFormat.DECIMAL
+            ),
+        ]
+        snapshot = _snapshot(lines)
+        
+        probabilities = snapshot.compute_implied_probabilities()
+        
+        for line, probability in zip(lines, probabilities):
+            expected = float(line.calculate_implied_probability())
+            assert probability == pytest.approx(expected)
+            assert float(line.implied_probability) == pytest.approx(expected)
+
+    def test_zero_american_odds_match_per_line(self):
+        """Should write Decimal("0"), not negative zero, for American odds of 0."""
+        line = OddsLine(selection="Warriors", odds=Decimal("0"))
+        
+        _snapshot([line]).compute_implied_probabilities()
+        
+        assert line.implied_probability == line.calculate_implied_probability()
+        assert not line.implied_probability.is_signed()
+
+    def test_zero_decimal_odds_raise(self):
+        """Should raise like the per-line calculation instead of writing Infinity."""
+        line = OddsLine.from_trusted(
+            selection="Draw", odds=Decimal("0"), odds_format=OddsFormat.DECIMAL
+        )
+        snapshot = _snapshot([OddsLine(selection="Warriors", odds=Decimal("-150")), line])
+        
+        with pytest.raises(ZeroDivisionError):
+            line.calculate_implied_probability()
+        with pytest.raises(ZeroDivisionError):
+            snapshot.compute_implied_probabilities()
+        assert snapshot.events[0].markets[0].lines[0].implied_probability is None
+
+
+class TestSnapshotLookup:
+    """Tests for OddsSnapshot.get_event."""
+    
+    def test_get_event(self):
+        """Should find events by ID and return None for unknown IDs."""
+        snapshot = _snapshot([OddsLine(selection="Warriors", odds=Decimal("-150"))])
+        
+        assert snapshot.get_event("evt_1") is snapshot.events[0]
+        assert snapshot.get_event("evt_missing") is None
+
+    def test_copy_rebuilds_index(self):
+        """Should look up the copy's own events after model_copy."""
+        snapshot = _snapshot([OddsLine(selection="Warriors", odds=Decimal("-150"))])
+        assert snapshot.get_event("evt_1") is snapshot.events[0]
+        
+        replacement = snapshot.events[0].model_copy(update={"event_id": "evt_2"})
+        updated = snapshot.model_copy(update={"events": [replacement]})
+        deep = snapshot.model_copy(deep=True)
+        
+        assert updated.get_event("evt_1") is None
+        assert updated.get_event("evt_2") is replacement
+        assert deep.get_event("evt_1") is deep.events[0]
+        assert snapshot.get_event("evt_1") is snapshot.events[0]
+
+    def test_snapshot_is_frozen(self):
+        """Should reject reassigning events so the index stays valid."""
+        snapshot = _snapshot([])
+        
+        with pytest.raises(ValidationError):
+            snapshot.events = []
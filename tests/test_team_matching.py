@@ -0,0 +1,188 @@
+"""
+Unit tests for team name verification.
+
+Covers:
+- Alias resolution to canonical names
+- Substring and fuzzy fallbacks
+- Fail-fast prediction verification
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import trust_layer.validator as validator_module
+from trust_layer.validator import AIPrediction, TrustLayerValidator, VerificationStatus
+
+
+class TestAliasLookup:
+    """Tests for the canonical alias map."""
+    
+    def test_slang_alias_is_verified(self):
+        """Should resolve "Dubs" to the Golden State Warriors."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Dubs", "Golden State Warriors")
+        assert result.status == VerificationStatus.VERIFIED
+
+    def test_different_known_teams_fail(self):
+        """Should fail when aliases resolve to different teams."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Clippers", "Los Angeles Lakers")
+        assert result.status == VerificationStatus.FAILED
+
+
+class TestFallbackMatching:
+    """Tests for names outside the alias map."""
+    
+    def test_substring_is_partial(self):
+        """Should give partial credit for substrings."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Denver", "Denver Nuggets")
+        assert result.status == VerificationStatus.PARTIAL
+        assert "partial match" in result.discrepancy.lower()
+
+    def test_unrelated_team_fails(self):
+        """Should reject hallucinated team names."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Seattle SuperSonics", "Denver Nuggets")
+        assert result.status == VerificationStatus.FAILED
+
+    def test_one_letter_nickname_change_fails(self):
+        """Should not treat a different team with a similar name as a match."""
+        validator = TrustLayerValidator()
+        
+        assert validator.verify_team_name("New York Jets", "New York Mets").status == VerificationStatus.FAILED
+        assert validator.verify_team_name("Miami Heet", "Miami Heat").status == VerificationStatus.FAILED
+
+    def test_city_typo_is_fuzzy_matched(self):
+        """Should still give credit for a misspelled city with the right nickname."""
+        pytest.importorskip("rapidfuzz")
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Denvr Nuggets", "Denver Nuggets")
+        assert result.status in (VerificationStatus.VERIFIED, VerificationStatus.PARTIAL)
+
+
+class TestFailFast:
+    """Tests for verify_prediction short-circuiting."""
+    
+    @staticmethod
+    def _prediction(team, confidence):
+        return AIPrediction(
+            event_id="evt_123",
+            prediction_type="moneyline",
+            predicted_value=team,
+            confidence=confidence,
+            reasoning="LeBron out",
+            generated_at=datetime.now(timezone.utc),
+        )
+
+    def test_stops_after_failed_team(self):
+        """Should skip remaining checks once the team is rejected."""
+        validator = TrustLayerValidator()
+        
+        passed, results = validator.verify_prediction(
+            self._prediction("Seattle SuperSonics", 1.5),
+            source_odds=Decimal("-150"),
+            source_team="Denver Nuggets",
+        )
+        
+        assert passed is False
+        assert len(results) == 1
+
+    def test_strict_mode_runs_all_checks(self):
+        """Should report every discrepancy when fail_fast is off."""
+        validator = TrustLayerValidator(fail_fast=False)
+        
+        passed, results = validator.verify_prediction(
+            self._prediction("Seattle SuperSonics", 1.5),
+            source_odds=Decimal("-150"),
+            source_team="Denver Nuggets",
+        )
+        
+        assert passed is False
+        assert [r.claim for r in results] == ["Team name", "Confidence score"]
+
+
+class TestAliasScan:
+    """Tests for aliases mentioned inside longer claims."""
+    
+    def test_alias_inside_phrase_is_partial(self):
+        """Should find a known alias within a longer claim."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Dubs at home", "Golden State Warriors")
+        assert result.status == VerificationStatus.PARTIAL
+
+    def test_other_team_inside_phrase_fails(self):
+        """Should fail when the phrase names a different known team."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Sixers at home", "Golden State Warriors")
+        assert result.status == VerificationStatus.FAILED
+
+    def test_alias_must_be_whole_word(self):
+        """Should not match aliases embedded inside other words."""
+        validator = TrustLayerValidator()
+        
+        result = validator.verify_team_name("Blackhawks", "Los Angeles Clippers")
+        assert result.status == VerificationStatus.FAILED
+        assert result.discrepancy == "Team name mismatch"
+
+    def test_regex_fallback_matches_automaton(self, monkeypatch):
+        """Should find the same aliases with and without pyahocorasick."""
+        pytest.importorskip("ahocorasick")
+        automaton_scan = validator_module._build_alias_scanner()
+        monkeypatch.setattr(validator_module, "ahocorasick", None)
+        regex_scan = validator_module._build_alias_scanner()
+        
+        for text in ("warriors_fan", "la lakers at gsw", "golden state warriors", "blackhawks", "celts9"):
+            assert regex_scan(text) == automaton_scan(text), text
+
+
+class TestPredictionBatch:
+    """Tests for verify_predictions."""
+    
+    def test_matches_serial_results(self):
+        """Should agree with verify_prediction and log every team check."""
+        items = [
+            (TestFailFast._prediction(team, 0.8), Decimal("-150"), source)
+            for team, source in [
+                ("Dubs", "Golden State Warriors"),
+                ("Seattle SuperSonics", "Denver Nuggets"),
+                ("Denver", "Denver Nuggets"),
+            ] * 10
+        ]
+        serial = TrustLayerValidator()
+        batched = TrustLayerValidator()
+        
+        expected = [serial.verify_prediction(*item) for item in items]
+        outcomes = batched.verify_predictions(items)
+        
+        assert [passed for passed, _ in outcomes] == [passed for passed, _ in expected]
+        assert [
+            [r.status for r in results] for _, results in outcomes
+        ] == [
+            [r.status for r in results] for _, results in expected
+        ]
+        assert batched.get_verification_summary() == serial.get_verification_summary()
+
+    def test_iterator_and_empty_input(self):
+        """Should accept any iterable of items, including an empty one."""
+        validator = TrustLayerValidator()
+        items = [(TestFailFast._prediction("Dubs", 0.8), Decimal("-150"), "Golden State Warriors")] * 3
+        
+        assert validator.verify_predictions([]) == []
+        outcomes = validator.verify_predictions(iter(items))
+        
+        assert [passed for passed, _ in outcomes] == [True] * 3
+        assert len(validator.verification_log) == 3